@@ -0,0 +1,102 @@
+# Cold start benchmark for the quiz app.
+#
+# Runs `python -X importtime` in a fresh interpreter for each target module,
+# repeats it a few times and reports the median cumulative import time of the
+# target, along with the heaviest of its direct imports. Exits non-zero
+# when a target goes over budget.
+#
+#   python bench_startup.py
+#   python bench_startup.py --runs 7 --budget-ms 1500
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Median cumulative import time allowed per target, in milliseconds
+DEFAULT_BUDGETS = {
+    "question_bank": 50,
+    "quiz_app": 1500,
+}
+
+# Imports that should never show up during a cold start
+LAZY_MODULES = ["matplotlib", "matplotlib.pyplot", "numpy"]
+
+
+def parse_importtime(stderr, target):
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    # and children are printed before their parent, so the depth-1 lines seen
+    # since the previous top-level import are the target's direct imports
+    total = 0
+    children = {}
+    pending = {}
+    loaded = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        name = name.strip()
+        loaded.add(name)
+        if depth == 1:
+            pending[name] = pending.get(name, 0) + int(parts[1])
+        elif depth == 0:
+            if name == target:
+                total = int(parts[1])
+                children = pending
+            pending = {}
+    return total, children, loaded
+
+
+def run_once(module):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr, module)
+
+
+def bench(module, runs):
+    samples = [run_once(module) for _ in range(runs)]
+    totals = [total / 1000 for total, _, _ in samples]
+    _, children, loaded = samples[-1]
+    heaviest = sorted(children.items(), key=lambda kv: kv[1], reverse=True)[:10]
+    loaded_lazy = [m for m in LAZY_MODULES if m in loaded]
+    return statistics.median(totals), heaviest, loaded_lazy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start import time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, help="Override the budget for every target")
+    parser.add_argument("targets", nargs="*", default=list(DEFAULT_BUDGETS))
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.targets:
+        budget = args.budget_ms if args.budget_ms is not None else DEFAULT_BUDGETS.get(module, 1000)
+        median_ms, heaviest, loaded_lazy = bench(module, args.runs)
+        status = "OK" if median_ms <= budget and not loaded_lazy else "OVER"
+        failed = failed or status != "OK"
+
+        print(f"{module}: {median_ms:.1f} ms median over {args.runs} runs (budget {budget:.0f} ms) {status}")
+        for name, us in heaviest:
+            print(f"    {us / 1000:8.1f} ms  {name}")
+        if loaded_lazy:
+            print(f"    eagerly imported: {', '.join(loaded_lazy)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
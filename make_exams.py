@@ -0,0 +1,266 @@
+# Command-line generator for printable mock exams.
+#
+#   python make_exams.py --count 1000 --seed 7 --out exams/
+#   python make_exams.py --count 20 --questions 90 --mix easy=1,medium=2,hard=1 --format pdf
+#
+# Exams are assembled in a process pool and are fully determined by --seed:
+# exam N is the same every run, whatever the worker count. Category counts
+# follow the CATEGORIES weights and each category is split by the difficulty
+# mix. Within a category/difficulty bucket, exams walk one seeded permutation
+# in consecutive slices, so questions are reused only after the whole bucket
+# has been handed out. Each exam is written by the worker that built it and
+# only its answer key comes back to be appended to answer_keys.jsonl, so
+# memory stays flat however many exams are requested. With --format pdf each
+# exam also gets a printable key, exam_NNNNN_key.pdf, next to it.
+
+import argparse
+import json
+import os
+import random
+import sys
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import question_bank
+from question_bank import CATEGORIES, DIFFICULTIES
+
+OPTION_LETTERS = "ABCDEFGH"
+
+_state = None
+
+
+# ===== PLANNING =====
+def largest_remainder(total, weights):
+    # Splits `total` into integers proportional to `weights`
+    weight_sum = sum(weights.values())
+    raw = {k: total * w / weight_sum for k, w in weights.items()}
+    counts = {k: int(v) for k, v in raw.items()}
+    leftover = total - sum(counts.values())
+    for k in sorted(raw, key=lambda k: (counts[k] - raw[k], k))[:leftover]:
+        counts[k] += 1
+    return counts
+
+def requested_quotas(questions_per_exam, mix):
+    # The category/difficulty split the weights and --mix ask for
+    per_category = largest_remainder(questions_per_exam, {c: CATEGORIES[c]['weight'] for c in CATEGORIES})
+    quotas = {}
+    for category, count in per_category.items():
+        for difficulty, n in largest_remainder(count, mix).items():
+            quotas[(category, difficulty)] = n
+    return quotas
+
+def plan_quotas(bank, questions_per_exam, mix):
+    quotas = requested_quotas(questions_per_exam, mix)
+    capacity = {(c, d): len(bank[c][d]) for c in CATEGORIES for d in DIFFICULTIES}
+
+    def spill(deficit, candidates):
+        # Moves as much of `deficit` as fits into the candidates with the most room
+        for other in sorted(candidates, key=lambda b: capacity[b] - quotas.get(b, 0), reverse=True):
+            spare = min(deficit, capacity[other] - quotas.get(other, 0))
+            if spare > 0:
+                quotas[other] = quotas.get(other, 0) + spare
+                deficit -= spare
+        return deficit
+
+    # Shortfalls in thin buckets move to the same difficulty in other
+    # categories first, so --mix holds whenever the bank allows it, then to the
+    # same category, then anywhere
+    shortfall = 0
+    for bucket in list(quotas):
+        deficit = quotas[bucket] - capacity[bucket]
+        if deficit <= 0:
+            continue
+        quotas[bucket] = capacity[bucket]
+        category, difficulty = bucket
+        deficit = spill(deficit, [(c, difficulty) for c in CATEGORIES if c != category])
+        deficit = spill(deficit, [(category, d) for d in DIFFICULTIES if d != difficulty])
+        shortfall += deficit
+    spill(shortfall, capacity)
+    return {bucket: n for bucket, n in quotas.items() if n > 0}
+
+def describe_split(quotas):
+    by_difficulty = {d: 0 for d in DIFFICULTIES}
+    for (_, difficulty), n in quotas.items():
+        by_difficulty[difficulty] += n
+    return ", ".join(f"{n} {d}" for d, n in by_difficulty.items())
+
+def prepare(bank_path, seed, questions_per_exam, mix, generated_per_template):
+    bank = question_bank.build_bank(question_bank.read_questions(bank_path))
+    if generated_per_template:
+        import question_generator
+        bank = question_generator.extend_bank(bank, seed, generated_per_template)
+
+    quotas = plan_quotas(bank, questions_per_exam, mix)
+    orders = {}
+    for category, difficulty in quotas:
+        order = list(bank[category][difficulty])
+        random.Random(f"{seed}:{category}:{difficulty}").shuffle(order)
+        orders[(category, difficulty)] = order
+    return {'seed': seed, 'quotas': quotas, 'orders': orders}
+
+# ===== WORKERS =====
+def init_worker(*args):
+    # With the fork start method the parent's state is inherited as is
+    global _state
+    if _state is None:
+        _state = prepare(*args)
+
+def assemble_exam(number):
+    questions = []
+    for bucket, n in _state['quotas'].items():
+        order = _state['orders'][bucket]
+        start = (number - 1) * n
+        questions.extend(order[(start + j) % len(order)] for j in range(n))
+    random.Random(f"{_state['seed']}:exam:{number}").shuffle(questions)
+    return questions
+
+def answer_key(number, questions):
+    answers = []
+    for i, q in enumerate(questions, 1):
+        index = q['options'].index(q['correct_answer']) if q['correct_answer'] in q['options'] else None
+        answers.append({
+            'number': i,
+            'id': question_bank.question_key(q),
+            'answer': OPTION_LETTERS[index] if index is not None else None,
+            'correct_answer': q['correct_answer'],
+        })
+    return {'exam': number, 'seed': _state['seed'], 'answers': answers}
+
+def write_exam_json(path, number, questions):
+    exam = {
+        'exam': number,
+        'seed': _state['seed'],
+        'questions': [{
+            'number': i,
+            'id': question_bank.question_key(q),
+            'topic': q.get('topic'),
+            'difficulty': q.get('difficulty'),
+            'question': q['question'],
+            'options': q['options'],
+        } for i, q in enumerate(questions, 1)],
+    }
+    with open(path, 'w') as f:
+        json.dump(exam, f, ensure_ascii=False, indent=1)
+
+def write_text_pdf(path, lines, lines_per_page=52):
+    # matplotlib is already a dependency; text pages are enough for print
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    with PdfPages(path) as pdf:
+        for start in range(0, len(lines), lines_per_page):
+            fig = plt.figure(figsize=(8.5, 11))
+            fig.text(0.07, 0.95, "\n".join(lines[start:start + lines_per_page]),
+                     va='top', ha='left', family='monospace', fontsize=8.5)
+            pdf.savefig(fig)
+            plt.close(fig)
+
+def write_exam_pdf(path, number, questions, width=95):
+    lines = [f"CFA Level I Mock Exam {number}", ""]
+    for i, q in enumerate(questions, 1):
+        lines += textwrap.wrap(f"{i}. {q['question']}", width)
+        for letter, option in zip(OPTION_LETTERS, q['options']):
+            lines += textwrap.wrap(f"{letter}) {option}", width, initial_indent="    ", subsequent_indent="       ")
+        lines.append("")
+    write_text_pdf(path, lines)
+
+def write_key_pdf(path, key, width=95):
+    lines = [f"CFA Level I Mock Exam {key['exam']} - Answer Key (seed {key['seed']})", ""]
+    for answer in key['answers']:
+        # Questions whose correct answer isn't among the options print it in full
+        lines += textwrap.wrap(f"{answer['number']:>3}. {answer['answer'] or answer['correct_answer']}", width,
+                               subsequent_indent="     ")
+    write_text_pdf(path, lines)
+
+def build_exam(task):
+    number, out_dir, formats = task
+    questions = assemble_exam(number)
+    stem = os.path.join(out_dir, f"exam_{number:05d}")
+    if 'json' in formats:
+        write_exam_json(stem + ".json", number, questions)
+    key = answer_key(number, questions)
+    if 'pdf' in formats:
+        write_exam_pdf(stem + ".pdf", number, questions)
+        write_key_pdf(stem + "_key.pdf", key)
+    return key
+
+# ===== CLI =====
+def int_at_least(minimum):
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {text}")
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {value}")
+        return value
+    return parse
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip().lower()
+        if name not in DIFFICULTIES:
+            raise argparse.ArgumentTypeError(f"unknown difficulty: {name}")
+        try:
+            mix[name] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight for {name}: {weight}")
+        if not mix[name] >= 0:
+            raise argparse.ArgumentTypeError(f"weight for {name} must not be negative")
+    if not sum(mix.values()) > 0:
+        raise argparse.ArgumentTypeError("difficulty weights must add up to more than 0")
+    return mix
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate printable CFA mock exams with answer keys")
+    parser.add_argument("--count", type=int_at_least(1), default=5, help="number of exams")
+    # Non-negative: numpy rejects negative seeds and generated IDs (TPL-<tpl>-<seed>-<n>) split on '-'
+    parser.add_argument("--seed", type=int_at_least(0), default=0, help="base seed; the same seed gives the same exams")
+    parser.add_argument("--questions", type=int_at_least(1), default=30, help="questions per exam")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("easy=1,medium=1,hard=1"),
+                        help="difficulty weights, e.g. easy=1,medium=2,hard=1")
+    parser.add_argument("--bank", default=question_bank.QUESTIONS_PATH, help="question bank JSON")
+    parser.add_argument("--generated-per-template", type=int_at_least(0), default=0,
+                        help="add this many formula-generated variants per template")
+    parser.add_argument("--format", choices=["json", "pdf", "both"], default="json")
+    parser.add_argument("--out", default="exams", help="output directory")
+    parser.add_argument("--workers", type=int_at_least(1), default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    setup = (args.bank, args.seed, args.questions, args.mix, args.generated_per_template)
+    global _state
+    _state = prepare(*setup)
+    planned = sum(_state['quotas'].values())
+    if planned < args.questions:
+        print(f"warning: bank only supports {planned} questions per exam", file=sys.stderr)
+    requested = {bucket: n for bucket, n in requested_quotas(args.questions, args.mix).items() if n > 0}
+    if _state['quotas'] != requested:
+        asked, got = describe_split(requested), describe_split(_state['quotas'])
+        if asked == got:
+            print(f"warning: bank is too thin for the category weights; kept the difficulty mix ({got}) "
+                  f"by drawing from other categories", file=sys.stderr)
+        else:
+            print(f"warning: bank is too thin for --mix; asked for {asked}, planned {got}", file=sys.stderr)
+
+    os.makedirs(args.out, exist_ok=True)
+    formats = {'json', 'pdf'} if args.format == 'both' else {args.format}
+    tasks = ((number, args.out, formats) for number in range(1, args.count + 1))
+    chunksize = max(1, args.count // (args.workers * 8))
+
+    with open(os.path.join(args.out, "answer_keys.jsonl"), 'w') as keys, \
+            ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=setup) as pool:
+        for key in pool.map(build_exam, tasks, chunksize=chunksize):
+            keys.write(json.dumps(key) + "\n")
+
+    elapsed = time.perf_counter() - started
+    print(f"{args.count} exams x {planned} questions written to {args.out} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
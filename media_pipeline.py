@@ -0,0 +1,204 @@
+# Image pipeline for question figures and page backgrounds.
+#
+# Build step (run before starting the app):
+#   python media_pipeline.py
+#
+# Every source image is resized into a few responsive widths, encoded as WebP
+# with a JPEG fallback (PNG when the source has transparency), and written to
+# Streamlit's static folder under a name that contains a hash of the source
+# bytes. A manifest maps the name used in
+# the question bank (the `image` field) to its variants. Unchanged sources are
+# skipped, so re-running the build is cheap.
+#
+# Streamlit serves ./static at app/static/ when server.enableStaticServing is
+# on (see .streamlit/config.toml).
+#
+# Limitation: Streamlit's app/static handler (1.66) sends ETag and
+# Last-Modified but no Cache-Control, and offers no hook to add one, so the
+# hashed names can't be marked immutable from here. To make the best of
+# it, every variant gets a fixed, old mtime: Last-Modified and the
+# mtime-based ETag are then identical across rebuilds and dynos. Browsers
+# apply heuristic freshness based on the age of Last-Modified, and any
+# revalidation is a 304. A long max-age needs a CDN or proxy in front of
+# app/static/media.
+
+import hashlib
+import html
+import json
+import os
+import threading
+
+SOURCE_DIR = 'Data/images'
+BACKGROUND_SOURCE = 'Data/background.jpg'
+OUTPUT_DIR = 'static/media'
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, 'manifest.json')
+STATIC_URL = 'app/static/media'
+
+WIDTHS = [480, 960, 1600]
+FALLBACK_MIME = {'png': 'image/png', 'jpg': 'image/jpeg'}
+# 2000-01-01; content-hashed files never change, so any old date is truthful
+VARIANT_MTIME = 946684800
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')
+DEFAULT_SIZES = "(max-width: 768px) 100vw, 768px"
+
+# ===== BUILD =====
+def content_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+def source_images():
+    sources = {}
+    if os.path.exists(BACKGROUND_SOURCE):
+        sources[os.path.basename(BACKGROUND_SOURCE)] = BACKGROUND_SOURCE
+    if os.path.isdir(SOURCE_DIR):
+        for root, _, files in os.walk(SOURCE_DIR):
+            for name in sorted(files):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    sources[os.path.relpath(path, SOURCE_DIR).replace(os.sep, '/')] = path
+    return sources
+
+def build_variants(key, path, previous=None):
+    from PIL import Image
+
+    digest = content_hash(path)
+    if previous and previous.get('hash') == digest and 'fallback' in previous and all(
+            os.path.exists(os.path.join(OUTPUT_DIR, name))
+            for variants in previous['variants'].values() for _, name in variants):
+        return previous
+
+    stem = os.path.splitext(key)[0].replace('/', '_')
+    with Image.open(path) as img:
+        img.load()
+        width, height = img.size
+        has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+        # A PNG of an opaque photo is several times larger than the JPEG source
+        fallback = 'png' if has_alpha else 'jpg'
+        formats = ['webp', fallback]
+
+        # Never upscale; images narrower than the smallest width get one variant
+        widths = [w for w in WIDTHS if w < width] + [width]
+        variants = {fmt: [] for fmt in formats}
+        for w in widths:
+            resized = img if w == width else img.resize((w, round(height * w / width)), Image.LANCZOS)
+            for fmt in formats:
+                name = f"{stem}.{digest}.{w}.{fmt}"
+                target = os.path.join(OUTPUT_DIR, name)
+                if not os.path.exists(target):
+                    if fmt == 'webp':
+                        resized.save(target, 'WEBP', quality=80, method=6)
+                    elif fmt == 'jpg':
+                        resized.save(target, 'JPEG', quality=82, optimize=True, progressive=True)
+                    else:
+                        resized.save(target, 'PNG', optimize=True)
+                    os.utime(target, (VARIANT_MTIME, VARIANT_MTIME))
+                variants[fmt].append([w, name])
+
+    return {'hash': digest, 'width': width, 'height': height, 'fallback': fallback, 'variants': variants}
+
+def build(verbose=True):
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+
+    manifest = {}
+    for key, path in source_images().items():
+        manifest[key] = build_variants(key, path, previous.get(key))
+        if verbose:
+            print(f"{key}: {manifest[key]['hash']} ({len(manifest[key]['variants']['webp'])} widths)")
+
+    # Drop files that no longer belong to any source
+    keep = {name for entry in manifest.values() for variants in entry['variants'].values() for _, name in variants}
+    for name in os.listdir(OUTPUT_DIR):
+        if name != os.path.basename(MANIFEST_PATH) and name not in keep:
+            os.remove(os.path.join(OUTPUT_DIR, name))
+
+    tmp_path = MANIFEST_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+    return manifest
+
+# ===== RUNTIME =====
+_lock = threading.Lock()
+_manifest = None
+_manifest_mtime = None
+
+def get_manifest():
+    # Reloaded only when the build step rewrites the manifest
+    global _manifest, _manifest_mtime
+    try:
+        mtime = os.path.getmtime(MANIFEST_PATH)
+    except OSError:
+        return {}
+    if mtime != _manifest_mtime:
+        with _lock:
+            if mtime != _manifest_mtime:
+                try:
+                    with open(MANIFEST_PATH, 'r') as f:
+                        _manifest = json.load(f)
+                except (OSError, ValueError):
+                    _manifest = {}
+                _manifest_mtime = mtime
+    return _manifest
+
+def image_url(key, max_width=None, fmt='webp'):
+    # fmt is 'webp' or 'fallback' (the entry's JPEG or PNG variants)
+    entry = get_manifest().get(key)
+    if not entry:
+        return None
+    variants = entry['variants'][entry['fallback'] if fmt == 'fallback' else fmt]
+    if max_width is not None:
+        for w, name in variants:
+            if w >= max_width:
+                return f"{STATIC_URL}/{name}"
+    return f"{STATIC_URL}/{variants[-1][1]}"
+
+def srcset(key, fmt):
+    entry = get_manifest()[key]
+    variants = entry['variants'][entry['fallback'] if fmt == 'fallback' else fmt]
+    return ", ".join(f"{STATIC_URL}/{name} {w}w" for w, name in variants)
+
+def picture_html(key, alt="", sizes=DEFAULT_SIZES):
+    entry = get_manifest().get(key)
+    if not entry:
+        return None
+    alt = html.escape(alt, quote=True)
+    fallback = image_url(key, 960, 'fallback')
+    return (
+        f'<picture>'
+        f'<source type="image/webp" srcset="{srcset(key, "webp")}" sizes="{sizes}">'
+        f'<img src="{fallback}" srcset="{srcset(key, "fallback")}" sizes="{sizes}" alt="{alt}" '
+        f'width="{entry["width"]}" height="{entry["height"]}" loading="lazy" decoding="async" '
+        f'style="max-width: 100%; height: auto;">'
+        f'</picture>'
+    )
+
+def preload_html(keys, sizes=DEFAULT_SIZES):
+    # Same srcset/sizes as picture_html, so the browser fetches exactly the
+    # variant the <picture> will pick for this screen width and pixel density
+    links = []
+    for key in keys:
+        if key in get_manifest():
+            links.append(f'<link rel="preload" as="image" type="image/webp" '
+                         f'imagesrcset="{srcset(key, "webp")}" imagesizes="{sizes}">')
+    return "".join(links)
+
+def background_css(key, fallback_url):
+    url = image_url(key, 1600)
+    if not url:
+        return f"background-image: url('{fallback_url}');"
+    fallback_url = image_url(key, 1600, 'fallback')
+    mime = FALLBACK_MIME[get_manifest()[key]['fallback']]
+    return (
+        f"background-image: url('{fallback_url}');\n"
+        f"            background-image: image-set(url('{url}') type('image/webp'), url('{fallback_url}') type('{mime}'));"
+    )
+
+
+if __name__ == "__main__":
+    build()
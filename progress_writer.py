@@ -0,0 +1,263 @@
+# Background persistence for progress data, saved quiz sessions and
+# telemetry events.
+#
+# The Streamlit script thread only enqueues; a single writer thread owns the
+# disk. Snapshots written to the same key are coalesced so only the newest
+# one hits disk, events are appended to JSON-lines files in batches, and
+# everything pending is flushed when the batch fills up, when the flush
+# interval passes, or at shutdown.
+#
+# A snapshot is any payload plus the function that persists it, keyed by
+# what it overwrites (a file path, a session row). Coalescing happens before
+# the queue: while a snapshot for a key is still
+# waiting, newer snapshots just replace its payload, so a burst of saves
+# costs one queue slot instead of filling the queue. A snapshot whose write
+# fails stays pending and is retried on the next flush, so readers keep
+# seeing it rather than the stale file on disk.
+#
+# JSON files written through write_json are also kept in memory after they
+# are flushed, so read_json only touches the disk the first time a process
+# reads a file. Writes from other processes are not picked up after that.
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+_STOP = object()
+_MISSING = object()
+
+
+class PersistenceWriter:
+    def __init__(self, max_queue=1000, max_batch=50, flush_interval=1.0):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._lock = threading.Lock()
+        # Snapshots accepted but not yet on disk, as key -> (payload, write_fn),
+        # so readers see their own writes
+        self._unflushed = {}
+        # Keys with a snapshot marker still in the queue
+        self._queued = set()
+        # Last accepted (or first read) payload per write_json path, None if
+        # the file didn't exist
+        self._latest = {}
+        self._metrics = {
+            'enqueued': 0,
+            'dropped': 0,
+            'coalesced': 0,
+            'written': 0,
+            'events_written': 0,
+            'flushes': 0,
+            'errors': 0,
+            'retries': 0,
+            'last_error': None,
+            'queue_high_water': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+        }
+
+    # ===== PRODUCER SIDE =====
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="persistence-writer", daemon=True)
+                self._thread.start()
+
+    def _offer(self, item):
+        # Never blocks the caller: a full queue drops the item and counts it
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._metrics['dropped'] += 1
+            return False
+        with self._lock:
+            self._metrics['enqueued'] += 1
+            self._metrics['queue_high_water'] = max(self._metrics['queue_high_water'], self._queue.qsize())
+        return True
+
+    def submit(self, key, payload, write_fn):
+        # write_fn(payload) runs on the writer thread; only the newest payload
+        # submitted for a key before the next flush is written
+        entry = (payload, write_fn)
+        with self._lock:
+            previous = self._unflushed.get(key)
+            self._unflushed[key] = entry
+            if key in self._queued:
+                self._metrics['coalesced'] += 1
+                return True
+            self._queued.add(key)
+
+        if not self._offer(('snapshot', key, None)):
+            with self._lock:
+                self._queued.discard(key)
+                if self._unflushed.get(key) is entry:
+                    if previous is None:
+                        del self._unflushed[key]
+                    else:
+                        self._unflushed[key] = previous
+            return False
+        return True
+
+    def pending(self, key):
+        # (payload,) for a snapshot not on disk yet, otherwise None
+        with self._lock:
+            entry = self._unflushed.get(key)
+        return None if entry is None else entry[:1]
+
+    def write_json(self, path, data):
+        # Serialized here so later changes to `data` can't race the writer
+        payload = json.dumps(data)
+        accepted = self.submit(path, payload, lambda payload: _replace_file(path, payload))
+        if accepted:
+            with self._lock:
+                self._latest[path] = payload
+        return accepted
+
+    def record_event(self, path, event):
+        return self._offer(('event', path, json.dumps(event)))
+
+    def read_json(self, path):
+        # Served from memory; the file is only read once per process
+        with self._lock:
+            payload = self._latest.get(path, _MISSING)
+        if payload is _MISSING:
+            try:
+                with open(path, 'r') as f:
+                    payload = f.read()
+            except FileNotFoundError:
+                payload = None
+            with self._lock:
+                # A write accepted while the file was being read wins
+                payload = self._latest.setdefault(path, payload)
+        if payload is None:
+            raise FileNotFoundError(path)
+        return json.loads(payload)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._metrics)
+            stats['unflushed'] = len(self._unflushed)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['queue_capacity'] = self._queue.maxsize
+        return stats
+
+    def shutdown(self, timeout=5.0):
+        # Drains everything already queued before the writer thread exits
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    # ===== WRITER THREAD =====
+    def _run(self):
+        snapshots = set()
+        events = {}
+        pending = 0
+        deadline = time.monotonic() + self.flush_interval
+        stopping = False
+
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                stopping = True
+            elif item is not None:
+                kind, path, payload = item
+                if kind == 'snapshot':
+                    snapshots.add(path)
+                else:
+                    events.setdefault(path, []).append(payload)
+                pending += 1
+
+            if stopping or pending >= self.max_batch or time.monotonic() >= deadline:
+                if pending:
+                    # Failed snapshots carry over into the next batch
+                    snapshots = self._flush(snapshots, events)
+                    events, pending = {}, len(snapshots)
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, snapshots, events):
+        # Returns the keys whose snapshot couldn't be written
+        started = time.perf_counter()
+        failed = set()
+        for key in snapshots:
+            with self._lock:
+                self._queued.discard(key)
+                entry = self._unflushed.get(key)
+            if entry is None:
+                continue
+            try:
+                entry[1](entry[0])
+                self._count('written')
+            except Exception as e:
+                self._error(e)
+                with self._lock:
+                    # Keep it pending; newer submits coalesce into the retry
+                    self._queued.add(key)
+                    self._metrics['retries'] += 1
+                failed.add(key)
+                continue
+            with self._lock:
+                # Only forget the snapshot if nothing newer was accepted meanwhile
+                if self._unflushed.get(key) is entry:
+                    del self._unflushed[key]
+
+        for path, lines in events.items():
+            try:
+                with open(path, 'a') as f:
+                    f.write("\n".join(lines) + "\n")
+                self._count('events_written', len(lines))
+            except OSError as e:
+                self._error(e)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._metrics['flushes'] += 1
+            self._metrics['last_flush_ms'] = elapsed_ms
+            self._metrics['max_flush_ms'] = max(self._metrics['max_flush_ms'], elapsed_ms)
+        return failed
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self._metrics[name] += n
+
+    def _error(self, exc):
+        with self._lock:
+            self._metrics['errors'] += 1
+            self._metrics['last_error'] = str(exc)
+
+
+def _replace_file(path, payload):
+    # Atomic, so readers never see a half-written file
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+# ===== SHARED INSTANCE =====
+_writer = None
+_writer_lock = threading.Lock()
+
+def get_writer():
+    # One writer per server process, drained on interpreter exit
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                writer = PersistenceWriter()
+                writer.start()
+                atexit.register(writer.shutdown)
+                _writer = writer
+    return _writer
@@ -0,0 +1,309 @@
+# Shared question bank for the quiz app.
+# Kept free of Streamlit imports so it loads fast and lives once per server
+# process: Streamlit re-executes quiz_app.py on every rerun, but imported
+# modules stay in sys.modules, so the bank parsed here is shared by all sessions.
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+QUESTIONS_PATH = 'Data/updated_questions_with_5_options_final.json'
+DIFFICULTIES = ['easy', 'medium', 'hard']
+DIGEST_CACHE_SIZE = 20000
+
+# Complete topic mapping
+TOPIC_TO_CATEGORY = {
+    "Ethical & Professional Standards": "Ethical and Professional Standards",
+    "Quantitative Methods": "Quantitative Methods",
+    "Economics": "Economics",
+    "Financial Reporting & Analysis": "Financial Statement Analysis",
+    "Corporate Issuers": "Corporate Issuers",
+    "Equity Investments": "Equity Investments",
+    "Fixed Income": "Fixed Income",
+    "Derivatives": "Derivatives",
+    "Alternative Investments": "Alternative Investments",
+    "Portfolio Management": "Portfolio Management"
+}
+
+# Complete categories data
+CATEGORIES = {
+    "Ethical and Professional Standards": {
+        "description": "Focuses on ethical principles and professional standards",
+        "weight": 0.15
+    },
+    "Quantitative Methods": {
+        "description": "Covers statistical tools for financial analysis",
+        "weight": 0.10
+    },
+    "Economics": {
+        "description": "Examines macroeconomic and microeconomic concepts",
+        "weight": 0.10
+    },
+    "Financial Statement Analysis": {
+        "description": "Analysis of financial statements",
+        "weight": 0.15
+    },
+    "Corporate Issuers": {
+        "description": "Characteristics of corporate issuers",
+        "weight": 0.10
+    },
+    "Equity Investments": {
+        "description": "Valuation of equity securities",
+        "weight": 0.11
+    },
+    "Fixed Income": {
+        "description": "Analysis of fixed-income securities",
+        "weight": 0.11
+    },
+    "Derivatives": {
+        "description": "Valuation of derivative securities",
+        "weight": 0.06
+    },
+    "Alternative Investments": {
+        "description": "Hedge funds, private equity, real estate",
+        "weight": 0.06
+    },
+    "Portfolio Management": {
+        "description": "Portfolio construction and risk management",
+        "weight": 0.06
+    }
+}
+
+# ===== BUILDING =====
+def empty_bank():
+    return {cat: {d: [] for d in DIFFICULTIES} for cat in CATEGORIES}
+
+def bucket_key(question):
+    topic = (question.get("topic") or "").strip()
+    category = TOPIC_TO_CATEGORY.get(topic, topic)
+    difficulty = (question.get("difficulty") or "medium").lower()
+    if category in CATEGORIES and difficulty in DIFFICULTIES:
+        return category, difficulty
+    return None
+
+def read_questions(path=QUESTIONS_PATH):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("questions", []), list):
+        raise ValueError(f"{path}: expected an object with a 'questions' list")
+    return [q for q in data.get("questions", []) if isinstance(q, dict)]
+
+def validate_questions(questions):
+    # Raises ValueError describing the first few malformed questions
+    problems = []
+    seen = set()
+    for i, q in enumerate(questions):
+        qid = q.get("id")
+        if not isinstance(qid, str) or not qid:
+            problems.append(f"#{i}: missing id")
+        elif qid in seen:
+            problems.append(f"#{i}: duplicate id {qid}")
+        seen.add(qid)
+        if not isinstance(q.get("question"), str):
+            problems.append(f"#{i}: missing question text")
+        if not isinstance(q.get("options"), list) or len(q["options"]) < 2:
+            problems.append(f"#{i}: needs at least two options")
+        if "correct_answer" not in q:
+            problems.append(f"#{i}: missing correct_answer")
+    if problems:
+        more = f" (+{len(problems) - 5} more)" if len(problems) > 5 else ""
+        raise ValueError("invalid questions: " + "; ".join(problems[:5]) + more)
+
+def build_bank(questions):
+    questions_by_category = empty_bank()
+    for question in questions:
+        key = bucket_key(question)
+        if key:
+            questions_by_category[key[0]][key[1]].append(question)
+    return questions_by_category
+
+# ===== SHARED INSTANCE =====
+_lock = threading.Lock()
+_bank = None
+_by_id = {}
+# Every version replaced or removed by a reload, as id -> {content hash: question}
+_retired = {}
+_version = 0
+_signature = None
+_digests = {}
+_warmup_thread = None
+_watcher_thread = None
+_reload_status = {'reloads': 0, 'errors': 0, 'last_error': None, 'last_error_at': None}
+
+def question_key(question):
+    return question.get("id") or question.get("question", "")
+
+def content_hash(question):
+    # Identifies one version of a question's content, stable across processes.
+    # Hashing costs ~10us, so it's memoized per question object; question dicts
+    # are never mutated once loaded or generated.
+    entry = _digests.get(id(question))
+    if entry is not None and entry[0] is question:
+        return entry[1]
+    encoded = json.dumps(question, sort_keys=True, separators=(',', ':')).encode()
+    digest = hashlib.sha1(encoded).hexdigest()[:12]
+    # Bounded for generated questions; dropping everything just means rehashing
+    if len(_digests) >= max(DIGEST_CACHE_SIZE, 2 * len(_by_id)):
+        _digests.clear()
+    # The entry holds the question so its id can't be reused while cached
+    _digests[id(question)] = (question, digest)
+    return digest
+
+def file_signature(path=QUESTIONS_PATH):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def get_bank():
+    # Parses the bank once per process; failures are not cached so the next
+    # caller retries
+    global _bank, _by_id, _version, _signature
+    if _bank is None:
+        with _lock:
+            if _bank is None:
+                signature = file_signature()
+                questions = read_questions()
+                _by_id = {question_key(q): q for q in questions}
+                _signature = signature
+                _version += 1
+                _bank = build_bank(questions)
+    return _bank
+
+def get_versioned_bank():
+    # Consistent (buckets, version) pair: a reload swaps bucket lists under the
+    # lock, so copying the category dicts under it can't mix two versions
+    get_bank()
+    with _lock:
+        return {cat: dict(buckets) for cat, buckets in _bank.items()}, _version
+
+def bank_version():
+    # Bumped on every load or reload; 0 until the bank has been read
+    return _version
+
+def get_question(question_id):
+    # Current version of a question, or the last one seen if it was removed
+    question = _by_id.get(question_id)
+    if question is None and _retired.get(question_id):
+        question = list(_retired[question_id].values())[-1]
+    return question
+
+def get_question_version(question_id, digest):
+    # The current or a retired version of a question whose content matches
+    # `digest`, or None if this process never had that version
+    question = _by_id.get(question_id)
+    if question is not None and content_hash(question) == digest:
+        return question
+    return _retired.get(question_id, {}).get(digest)
+
+def warm_bank_async():
+    # Starts parsing the bank in the background at server boot so the first
+    # session doesn't pay for it. Safe to call on every rerun.
+    global _warmup_thread
+    if _bank is not None or _warmup_thread is not None:
+        return
+    with _lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=_warm, name="question-bank-warmup", daemon=True)
+            _warmup_thread.start()
+
+def _warm():
+    try:
+        get_bank()
+    except Exception:
+        # The foreground load reports the error to the user
+        pass
+
+# ===== HOT RELOAD =====
+def diff_questions(old_by_id, new_by_id):
+    added = [k for k in new_by_id if k not in old_by_id]
+    removed = [k for k in old_by_id if k not in new_by_id]
+    changed = [k for k in new_by_id if k in old_by_id and new_by_id[k] != old_by_id[k]]
+    return {'added': added, 'changed': changed, 'removed': removed}
+
+def apply_diff(new_questions, new_by_id, diff):
+    # Only buckets touched by the diff are rebuilt, and each one is swapped in
+    # as a new list so readers iterating the old list never see it change.
+    # Unchanged questions keep their dict objects; changed ones get new dicts,
+    # so sessions holding the old dicts stay pinned to the version they started.
+    global _by_id, _version
+    touched = set()
+    for key in diff['added'] + diff['changed']:
+        touched.add(bucket_key(new_by_id[key]))
+    for key in diff['changed'] + diff['removed']:
+        touched.add(bucket_key(_by_id[key]))
+    touched.discard(None)
+
+    rebuilt = {bucket: [] for bucket in touched}
+    for question in new_questions:
+        bucket = bucket_key(question)
+        if bucket in rebuilt:
+            current = _by_id.get(question_key(question))
+            rebuilt[bucket].append(current if current == question else question)
+
+    # Changed keys keep their old versions so saved sessions can still resolve them
+    for key in diff['changed'] + diff['removed']:
+        _retired.setdefault(key, {})[content_hash(_by_id[key])] = _by_id[key]
+    for key in diff['added']:
+        _retired.pop(key, None)
+
+    # Reuse existing dicts for unchanged questions in the index as well
+    _by_id = {k: (_by_id[k] if k in _by_id and k not in diff['changed'] else q) for k, q in new_by_id.items()}
+    for (category, difficulty), questions in rebuilt.items():
+        _bank[category][difficulty] = questions
+    _version += 1
+
+def reload_if_changed(path=QUESTIONS_PATH):
+    # Returns the applied diff, or None when the file is unchanged or the
+    # bank hasn't been loaded yet
+    global _signature
+    if _bank is None:
+        return None
+    signature = file_signature(path)
+    if signature == _signature:
+        return None
+
+    # Parse, validate and diff outside the lock; only the swap is serialized,
+    # so a file that fails here leaves the current bank untouched
+    new_questions = read_questions(path)
+    validate_questions(new_questions)
+    new_by_id = {question_key(q): q for q in new_questions}
+    with _lock:
+        diff = diff_questions(_by_id, new_by_id)
+        if any(diff.values()):
+            apply_diff(new_questions, new_by_id, diff)
+            _reload_status['reloads'] += 1
+        _signature = signature
+        _reload_status['last_error'] = None
+    return diff
+
+def reload_status():
+    # Reload counters and the last error the watcher swallowed
+    return dict(_reload_status, version=_version)
+
+def start_watcher(interval=2.0):
+    # Polls the bank file and applies changes in place. Safe to call on every rerun.
+    global _watcher_thread
+    if _watcher_thread is not None:
+        return
+    with _lock:
+        if _watcher_thread is None:
+            _watcher_thread = threading.Thread(target=_watch, args=(interval,), name="question-bank-watcher", daemon=True)
+            _watcher_thread.start()
+
+def _watch(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            reload_if_changed()
+        except Exception as e:
+            # Half-written, missing or malformed file: keep serving the current
+            # bank and try again on the next tick. The signature isn't updated,
+            # so a fixed file is picked up as soon as it lands.
+            message = f"{type(e).__name__}: {e}"
+            if message != _reload_status['last_error']:
+                print(f"question bank reload failed, keeping version {_version}: {message}", file=sys.stderr)
+            _reload_status['errors'] += 1
+            _reload_status['last_error'] = message
+            _reload_status['last_error_at'] = time.time()
@@ -0,0 +1,251 @@
+# Parameterized numeric questions built from formula templates.
+#
+# Each template samples its inputs for a whole block of questions at once
+# with numpy, computes the correct answer and a set of distractors that
+# model common mistakes (compounding instead of discounting, forgetting the
+# risk-free rate, mixing up Macaulay and modified duration, ...), and only
+# then formats the items one by one.
+#
+# Generated IDs look like TPL-PV-<seed>-<n>. Question n always comes from
+# block n // BLOCK_SIZE of that seed, so any generated item can be rebuilt
+# from its ID alone, which keeps grading and resumed sessions reproducible.
+
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from question_bank import bucket_key
+
+ID_PREFIX = "TPL"
+BLOCK_SIZE = 32
+NUM_OPTIONS = 4
+
+
+def _money(x):
+    return f"${x:,.2f}"
+
+def _ratio(x):
+    return f"{x:.3f}"
+
+def _years(x):
+    return f"{x:.2f} years"
+
+def _percent(x):
+    return f"{x:+.3f}%"
+
+
+def _rates(rng, n, low, high, step=0.0025):
+    # Rates on a quarter-point grid read like real exam inputs
+    return np.round(rng.uniform(low, high, n) / step) * step
+
+
+def _bond_cash_flows(p):
+    # Annual-pay bond with face 100, padded to 10 years and masked per item
+    t = np.arange(1, 11)
+    coupon = 100 * p['coupon'][:, None] * (t <= p['n'][:, None])
+    cf = coupon + 100 * (t == p['n'][:, None])
+    discount = (1 + p['ytm'][:, None]) ** -t
+    price = (cf * discount).sum(axis=1)
+    macaulay = (t * cf * discount).sum(axis=1) / price
+    return price, macaulay
+
+
+# ===== TEMPLATES =====
+TEMPLATES = {
+    "PV": {
+        "topic": "Quantitative Methods",
+        "difficulty": "Easy",
+        "subtopic": "Time Value of Money",
+        "formula_used": "PV = FV / (1 + r)^n",
+        "LOS_reference": "Quantitative Methods - Time Value of Money",
+        "sample": lambda rng, n: {
+            'fv': np.round(rng.uniform(1_000, 100_000, n), -2),
+            'r': _rates(rng, n, 0.02, 0.12),
+            'n': rng.integers(2, 31, n),
+        },
+        "answer": lambda p: p['fv'] / (1 + p['r']) ** p['n'],
+        "distractors": [
+            lambda p: p['fv'] * (1 + p['r']) ** p['n'],   # compounded instead of discounting
+            lambda p: p['fv'] / (1 + p['r'] * p['n']),    # simple interest
+            lambda p: p['fv'] / (1 + p['r']) ** (p['n'] - 1),  # one period short
+        ],
+        "format": _money,
+        "question": "What is the present value of {fv} received in {n} years if the annual discount rate is {r}?",
+        "explanation": "PV = {fv} / (1 + {r})^{n} = {answer}.",
+    },
+    "PVA": {
+        "topic": "Quantitative Methods",
+        "difficulty": "Medium",
+        "subtopic": "Time Value of Money",
+        "formula_used": "PV = PMT × [1 - (1 + r)^-n] / r",
+        "LOS_reference": "Quantitative Methods - Time Value of Money",
+        "sample": lambda rng, n: {
+            'pmt': np.round(rng.uniform(500, 20_000, n), -1),
+            'r': _rates(rng, n, 0.02, 0.12),
+            'n': rng.integers(3, 26, n),
+        },
+        "answer": lambda p: p['pmt'] * (1 - (1 + p['r']) ** -p['n']) / p['r'],
+        "distractors": [
+            lambda p: p['pmt'] * (1 - (1 + p['r']) ** -p['n']) / p['r'] * (1 + p['r']),  # treated as annuity due
+            lambda p: p['pmt'] * p['n'] / (1 + p['r']) ** p['n'],  # discounted the total as one lump sum
+            lambda p: p['pmt'] / p['r'],                            # valued as a perpetuity
+        ],
+        "format": _money,
+        "question": "An ordinary annuity pays {pmt} at the end of each year for {n} years. "
+                    "At an annual discount rate of {r}, what is its present value?",
+        "explanation": "PV = {pmt} × [1 - (1 + {r})^-{n}] / {r} = {answer}.",
+    },
+    "SHARPE": {
+        "topic": "Portfolio Management",
+        "difficulty": "Easy",
+        "subtopic": "Risk-Adjusted Performance",
+        "formula_used": "Sharpe Ratio = (Rp - Rf) / σp",
+        "LOS_reference": "Portfolio Management - Risk and Return",
+        "sample": lambda rng, n: {
+            'rp': _rates(rng, n, 0.06, 0.18),
+            'rf': _rates(rng, n, 0.005, 0.05),
+            'sigma': _rates(rng, n, 0.08, 0.30, step=0.005),
+        },
+        "answer": lambda p: (p['rp'] - p['rf']) / p['sigma'],
+        "distractors": [
+            lambda p: p['rp'] / p['sigma'],                   # forgot the risk-free rate
+            lambda p: (p['rp'] - p['rf']) / p['sigma'] ** 2,  # divided by variance
+            lambda p: (p['rp'] + p['rf']) / p['sigma'],       # added the risk-free rate
+        ],
+        "format": _ratio,
+        "question": "A portfolio returned {rp} with a standard deviation of {sigma}. "
+                    "If the risk-free rate is {rf}, what is the portfolio's Sharpe ratio?",
+        "explanation": "Sharpe = ({rp} - {rf}) / {sigma} = {answer}.",
+    },
+    "MODDUR": {
+        "topic": "Fixed Income",
+        "difficulty": "Hard",
+        "subtopic": "Duration and Interest Rate Risk",
+        "formula_used": "Modified Duration = Macaulay Duration / (1 + YTM)",
+        "LOS_reference": "Fixed Income - Duration and Convexity",
+        "sample": lambda rng, n: {
+            'coupon': _rates(rng, n, 0.02, 0.10, step=0.005),
+            'ytm': _rates(rng, n, 0.02, 0.10),
+            'n': rng.integers(2, 11, n),
+        },
+        "answer": lambda p: _bond_cash_flows(p)[1] / (1 + p['ytm']),
+        "distractors": [
+            lambda p: _bond_cash_flows(p)[1],                    # reported Macaulay duration
+            lambda p: _bond_cash_flows(p)[1] * (1 + p['ytm']),   # multiplied instead of divided
+            lambda p: p['n'].astype(float),                      # used the maturity
+        ],
+        "format": _years,
+        "question": "A {n}-year bond pays an annual coupon of {coupon} and yields {ytm}. "
+                    "What is its modified duration?",
+        "explanation": "Macaulay duration is the PV-weighted average time of the cash flows; "
+                       "dividing it by (1 + {ytm}) gives a modified duration of {answer}.",
+    },
+    "DURPX": {
+        "topic": "Fixed Income",
+        "difficulty": "Medium",
+        "subtopic": "Duration and Interest Rate Risk",
+        "formula_used": "%ΔP ≈ -Modified Duration × Δy",
+        "LOS_reference": "Fixed Income - Duration and Convexity",
+        "sample": lambda rng, n: {
+            'duration': np.round(rng.uniform(1.5, 12, n), 1),
+            'bps': rng.choice([-1, 1], n) * rng.integers(2, 31, n) * 5,
+        },
+        "answer": lambda p: -p['duration'] * p['bps'] / 100,
+        "distractors": [
+            lambda p: p['duration'] * p['bps'] / 100,        # wrong sign
+            lambda p: -p['duration'] * p['bps'] / 10,        # basis points scaled as tenths of a percent
+            lambda p: -p['duration'] * p['bps'] / 200,       # halved like a convexity term
+        ],
+        "format": _percent,
+        "question": "A bond has a modified duration of {duration}. Approximately how much will its price "
+                    "change if yields move by {bps} bps?",
+        "explanation": "%ΔP ≈ -{duration} × ({bps} / 10,000) = {answer}.",
+    },
+}
+
+# How raw sampled inputs are shown in the question text
+_PARAM_FORMATS = {
+    'fv': _money, 'pmt': _money,
+    'r': lambda x: f"{x:.2%}", 'rp': lambda x: f"{x:.2%}", 'rf': lambda x: f"{x:.2%}",
+    'sigma': lambda x: f"{x:.1%}", 'coupon': lambda x: f"{x:.1%}", 'ytm': lambda x: f"{x:.2%}",
+    'duration': lambda x: f"{x:.1f}", 'bps': lambda x: f"{int(x):+d}", 'n': lambda x: f"{int(x)}",
+}
+
+
+# ===== GENERATION =====
+def _rng(template_id, seed, block):
+    return np.random.default_rng([seed, zlib.crc32(template_id.encode()), block])
+
+def _unique_options(fmt, answer, distractors):
+    options = [fmt(answer)]
+    for value in distractors:
+        label = fmt(value)
+        bump = 1
+        # A mistake that happens to land on the right answer would make the item ambiguous
+        while label in options:
+            label = fmt(value * (1 + 0.07 * bump) if value else 0.07 * bump)
+            bump += 1
+        options.append(label)
+    return options
+
+@lru_cache(maxsize=512)
+def generate_block(template_id, seed, block):
+    template = TEMPLATES[template_id]
+    rng = _rng(template_id, seed, block)
+    params = template['sample'](rng, BLOCK_SIZE)
+    answers = template['answer'](params)
+    distractors = np.column_stack([f(params) for f in template['distractors']])
+    # Correct option position for each item, drawn for the whole block
+    positions = rng.integers(0, NUM_OPTIONS, BLOCK_SIZE)
+
+    fmt = template['format']
+    questions = []
+    for i in range(BLOCK_SIZE):
+        shown = {k: _PARAM_FORMATS[k](v[i]) for k, v in params.items()}
+        options = _unique_options(fmt, answers[i], distractors[i])
+        correct = options.pop(0)
+        options.insert(int(positions[i]), correct)
+        questions.append({
+            'id': f"{ID_PREFIX}-{template_id}-{seed}-{block * BLOCK_SIZE + i}",
+            'topic': template['topic'],
+            'difficulty': template['difficulty'],
+            'question': template['question'].format(**shown),
+            'options': options,
+            'correct_answer': correct,
+            'explanation': template['explanation'].format(answer=correct, **shown),
+            'subtopic': template['subtopic'],
+            'formula_used': template['formula_used'],
+            'keywords': ['generated'],
+            'LOS_reference': template['LOS_reference'],
+            'image': None,
+        })
+    return tuple(questions)
+
+def generate(template_id, seed, count):
+    questions = []
+    for block in range((count + BLOCK_SIZE - 1) // BLOCK_SIZE):
+        questions.extend(generate_block(template_id, seed, block))
+    return questions[:count]
+
+def get_question(question_id):
+    # Rebuilds a generated question from its ID; None for bank questions
+    parts = question_id.split('-')
+    if len(parts) != 4 or parts[0] != ID_PREFIX or parts[1] not in TEMPLATES:
+        return None
+    try:
+        seed, index = int(parts[2]), int(parts[3])
+    except ValueError:
+        return None
+    return generate_block(parts[1], seed, index // BLOCK_SIZE)[index % BLOCK_SIZE]
+
+def extend_bank(questions_by_category, seed, per_template):
+    # Returns a new category/difficulty map with generated variants appended;
+    # the shared bank lists are left untouched
+    extended = {cat: {d: list(qs) for d, qs in buckets.items()} for cat, buckets in questions_by_category.items()}
+    for template_id in TEMPLATES:
+        for question in generate(template_id, seed, per_template):
+            key = bucket_key(question)
+            if key:
+                extended[key[0]][key[1]].append(question)
+    return extended
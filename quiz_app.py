@@ -9,19 +9,39 @@ st.set_page_config(
 
 import os
 import time
-import json
-import matplotlib.pyplot as plt
 import random
+import secrets
 from datetime import datetime
 
+import media_pipeline
+import progress_writer
+import question_bank
+import render_cache
+import session_store
+from question_bank import CATEGORIES
+
+# Parse the question bank in the background while the first session sits on
+# the main menu (which doesn't need it), then pick up edits to the bank file
+# without restarting
+question_bank.warm_bank_async()
+question_bank.start_watcher()
+
+# ===== LAZY IMPORTS =====
+
+def get_pyplot():
+    # matplotlib is only needed for charts, so keep it out of cold start
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
 # ===== CUSTOM CSS =====
 
-def inject_custom_css():
-    st.markdown("""
+CUSTOM_CSS = """
     <style>
         /* Global background image */
         html, body, .stApp {
-            background-image: url('Data/background.jpg');
+            {background}
             background-size: cover;
             background-attachment: fixed;
             background-position: center;
@@ -50,13 +70,21 @@ def inject_custom_css():
             box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
         }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def inject_custom_css():
+    background = media_pipeline.background_css("background.jpg", "Data/background.jpg")
+    st.markdown(CUSTOM_CSS.replace("{background}", background), unsafe_allow_html=True)
 
 
 # ===== CFA CONFIGURATION =====
 QUIZ_TITLE = "CFA Exam Preparation Pro"
 CFA_REGISTRATION_URL = "https://www.cfainstitute.org/"
 STUDY_GUIDE_PATH = "Data/CFA_Study_Guide.pdf"
+PROGRESS_DATA_PATH = "Data/progress_data.json"
+TELEMETRY_EVENTS_PATH = "Data/telemetry_events.jsonl"
+PRELOAD_AHEAD = 2  # upcoming questions whose images are fetched early
+GENERATED_PER_TEMPLATE = 10  # fresh formula-based variants per session and template
 REGISTRATION_TIPS = """
 • Early registration discounts available
 • Prepare payment method in advance  
@@ -64,85 +92,30 @@ REGISTRATION_TIPS = """
 • Check exam schedule carefully
 """
 
-# Complete topic mapping
-TOPIC_TO_CATEGORY = {
-    "Ethical & Professional Standards": "Ethical and Professional Standards",
-    "Quantitative Methods": "Quantitative Methods", 
-    "Economics": "Economics",
-    "Financial Reporting & Analysis": "Financial Statement Analysis",
-    "Corporate Issuers": "Corporate Issuers",
-    "Equity Investments": "Equity Investments",
-    "Fixed Income": "Fixed Income",
-    "Derivatives": "Derivatives",
-    "Alternative Investments": "Alternative Investments",
-    "Portfolio Management": "Portfolio Management"
-}
-
-# Complete categories data
-CATEGORIES = {
-    "Ethical and Professional Standards": {
-        "description": "Focuses on ethical principles and professional standards",
-        "weight": 0.15
-    },
-    "Quantitative Methods": {
-        "description": "Covers statistical tools for financial analysis",
-        "weight": 0.10
-    },
-    "Economics": {
-        "description": "Examines macroeconomic and microeconomic concepts",
-        "weight": 0.10
-    },
-    "Financial Statement Analysis": {
-        "description": "Analysis of financial statements", 
-        "weight": 0.15
-    },
-    "Corporate Issuers": {
-        "description": "Characteristics of corporate issuers",
-        "weight": 0.10
-    },
-    "Equity Investments": {
-        "description": "Valuation of equity securities",
-        "weight": 0.11
-    },
-    "Fixed Income": {
-        "description": "Analysis of fixed-income securities",
-        "weight": 0.11
-    },
-    "Derivatives": {
-        "description": "Valuation of derivative securities",
-        "weight": 0.06
-    },
-    "Alternative Investments": {
-        "description": "Hedge funds, private equity, real estate",
-        "weight": 0.06
-    },
-    "Portfolio Management": {
-        "description": "Portfolio construction and risk management",
-        "weight": 0.06
-    }
-}
-
 # ===== LOAD QUESTIONS =====
-def load_questions():
+def load_questions(generator_seed=None):
+    # Returns the buckets together with the bank version they were copied from
     try:
-        with open('Data/updated_questions_with_5_options_final.json', 'r') as f:
-            questions_data = json.load(f)
-        
-        questions_by_category = {cat: {'easy': [], 'medium': [], 'hard': []} for cat in CATEGORIES}
-        
-        for question in questions_data.get("questions", []):
-            topic = question.get("topic", "").strip()
-            category = TOPIC_TO_CATEGORY.get(topic, topic)
-            difficulty = question.get("difficulty", "medium").lower()
-            
-            if category in questions_by_category and difficulty in ['easy', 'medium', 'hard']:
-                questions_by_category[category][difficulty].append(question)
-        
-        return questions_by_category
-        
+        bank, version = question_bank.get_versioned_bank()
+        if generator_seed is None:
+            return bank, version
+        # numpy-backed, so imported on first load rather than at cold start
+        import question_generator
+        return question_generator.extend_bank(bank, generator_seed, GENERATED_PER_TEMPLATE), version
     except Exception as e:
         st.error(f"Error loading questions: {str(e)}")
-        return {cat: {'easy': [], 'medium': [], 'hard': []} for cat in CATEGORIES}
+        return {cat: {'easy': [], 'medium': [], 'hard': []} for cat in CATEGORIES}, 0
+
+def get_all_questions():
+    # Loaded when a quiz or the topic list first needs it rather than on the
+    # first render, and refreshed after a hot reload. Quizzes in progress keep
+    # the question versions they started with.
+    quiz = st.session_state.quiz
+    if quiz['all_questions'] is None or quiz['bank_version'] != question_bank.bank_version():
+        # The version comes from the same snapshot as the buckets; reading it
+        # afterwards could tag old content with a newer version
+        quiz['all_questions'], quiz['bank_version'] = load_questions(quiz['generator_seed'])
+    return quiz['all_questions']
 
 # ===== PROGRESS TRACKING =====
 def init_progress_tracking():
@@ -162,25 +135,40 @@ def save_progress(score, total_questions, total_time):
     st.session_state.progress['scores'].append(score/total_questions)
     st.session_state.progress['time_spent'].append(total_time)
     st.session_state.progress['dates'].append(datetime.now().strftime("%Y-%m-%d"))
-    
-    try:
-        with open('Data/progress_data.json', 'w') as f:
-            json.dump(st.session_state.progress, f)
-    except:
+    persist_progress()
+
+def persist_progress():
+    # Queued for the background writer; only fails if its queue is full
+    if not progress_writer.get_writer().write_json(PROGRESS_DATA_PATH, st.session_state.progress):
         st.error("Could not save progress data")
 
+def track_event(event_type, **details):
+    progress_writer.get_writer().record_event(TELEMETRY_EVENTS_PATH, {
+        'type': event_type,
+        'timestamp': datetime.now().isoformat(),
+        **details
+    })
+
+def load_progress_data():
+    return progress_writer.get_writer().read_json(PROGRESS_DATA_PATH)
+
 def track_registration_click():
     init_progress_tracking()
     st.session_state.progress['registration_clicks'] += 1
     st.session_state.progress['last_registration_click'] = datetime.now().isoformat()
-    save_progress(0, 1, 0)
+    persist_progress()
+    track_event('registration_click', url=CFA_REGISTRATION_URL)
 
 # ===== QUIZ ENGINE =====
 def initialize_session_state():
     if 'initialized' not in st.session_state:
+        resume_key = st.query_params.get("resume")
+        generator_seed = random.randrange(2**31)
         st.session_state.update({
             'quiz': {
-                'all_questions': load_questions(),
+                'all_questions': None,
+                'generator_seed': generator_seed,
+                'bank_version': 0,
                 'current_questions': [],
                 'score': 0,
                 'current_index': 0,
@@ -189,22 +177,75 @@ def initialize_session_state():
                 'start_time': time.time(),
                 'question_start': time.time(),
                 'time_spent': [],
+                'answers': [],
                 'mode': 'main_menu',
                 'selected_category': None,
                 'test_type': None,
                 'exam_number': None
             },
             'sidebar_view': 'practice',
+            'resume_key': resume_key or secrets.token_urlsafe(8),
             'initialized': True,
             'confirm_registration': True
         })
+        if resume_key:
+            resume_session(resume_key)
     init_progress_tracking()
 
+# ===== RENDER CACHE =====
+def question_block(question, part, build):
+    # Keyed by the question's content, so a session pinned to an older copy of
+    # an edited question (or one restored in another process) never shares an
+    # entry with the new one
+    key = (question_bank.question_key(question), question_bank.content_hash(question), part)
+    return render_cache.question_blocks.get_or_set(key, build)
+
+def cached_fragment(key, build):
+    # A hit costs about 1us, so only for fragments that take longer to build
+    # than that; plain f-strings are rendered directly
+    return render_cache.fragments.get_or_set(key, build)
+
+def metric_card_html(label, value, font_size=24):
+    return f"""
+    <div class='metric-card'>
+        <div style="font-size: 16px; color: #7f8c8d;">{label}</div>
+        <div style="font-size: {font_size}px; font-weight: bold; color: #2c3e50;">{value}</div>
+    </div>
+    """
+
+# ===== RESUMABLE SESSIONS =====
+def resume_session(key):
+    blob = session_store.get_store().load(key)
+    if not blob:
+        return False
+    # Restoring resolves question IDs through the in-memory bank
+    get_all_questions()
+    state = session_store.deserialize(blob)
+    if state is None:
+        st.warning("That saved quiz can no longer be restored")
+        return False
+    updated = state.pop('updated_questions')
+    if updated:
+        st.info(f"{updated} upcoming question(s) were revised since this quiz was saved "
+                "and will be shown in their current version")
+    st.session_state.quiz.update(state)
+    st.session_state.resume_key = key
+    return True
+
+def checkpoint_session():
+    # Queued on the background writer, so this costs a few hundred bytes of
+    # encoding per rerun and no disk I/O
+    key = st.session_state.resume_key
+    session_store.get_store().save(key, session_store.serialize(st.session_state.quiz))
+    if st.query_params.get("resume") != key:
+        st.query_params["resume"] = key
+
 def format_time(seconds):
     return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
 
 def display_result_chart():
     score = st.session_state.quiz['score'] / len(st.session_state.quiz['current_questions'])
+    plt = get_pyplot()
     fig, ax = plt.subplots()
     ax.bar(['Your Score', 'Benchmark'], [score, 0.75], color=['#3498db', '#95a5a6'])
     ax.set_ylim([0, 1])
@@ -216,23 +257,17 @@ def show_results():
     avg_time = sum(quiz['time_spent'])/len(quiz['time_spent']) if quiz['time_spent'] else 0
     
     save_progress(quiz['score'], len(quiz['current_questions']), total_time)
+    session_store.get_store().delete(st.session_state.resume_key)
     
+    score = f"{quiz['score']}/{len(quiz['current_questions'])}"
+    total, average = format_time(total_time), format_time(avg_time)
     st.markdown(f"""
     <div class='card'>
         <h2 style="color: #2c3e50; margin-top: 0;">Quiz Completed!</h2>
         <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; margin: 20px 0;">
-            <div class='metric-card'>
-                <div style="font-size: 16px; color: #7f8c8d;">Score</div>
-                <div style="font-size: 32px; font-weight: bold; color: #2c3e50;">{quiz['score']}/{len(quiz['current_questions'])}</div>
-            </div>
-            <div class='metric-card'>
-                <div style="font-size: 16px; color: #7f8c8d;">Total Time</div>
-                <div style="font-size: 32px; font-weight: bold; color: #2c3e50;">{format_time(total_time)}</div>
-            </div>
-            <div class='metric-card'>
-                <div style="font-size: 16px; color: #7f8c8d;">Avg/Question</div>
-                <div style="font-size: 32px; font-weight: bold; color: #2c3e50;">{format_time(avg_time)}</div>
-            </div>
+            {metric_card_html("Score", score, 32)}
+            {metric_card_html("Total Time", total, 32)}
+            {metric_card_html("Avg/Question", average, 32)}
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -253,6 +288,10 @@ def process_answer(question, user_answer):
     time_spent = time.time() - st.session_state.quiz['question_start']
     st.session_state.quiz['time_spent'].append(time_spent)
     st.session_state.quiz['submitted'] = True
+    options = question.get('options', [])
+    st.session_state.quiz['answers'].append(
+        options.index(user_answer) if user_answer in options else session_store.NO_ANSWER
+    )
     
     if user_answer == question['correct_answer']:
         st.session_state.quiz['score'] += 1
@@ -261,7 +300,7 @@ def process_answer(question, user_answer):
         st.error(f"❌ Incorrect. The correct answer is: {question['correct_answer']}")
     
     if 'explanation' in question:
-        st.info(f"**Explanation:** {question['explanation']}")
+        st.info(question_block(question, 'explanation', lambda: f"**Explanation:** {question['explanation']}"))
 
 def show_next_button():
     if st.button("Next Question", use_container_width=True):
@@ -270,6 +309,24 @@ def show_next_button():
         st.session_state.quiz['question_start'] = time.time()
         st.rerun()
 
+def display_question_image(question):
+    picture = media_pipeline.picture_html(question['image'], alt=question.get('subtopic', ''))
+    if picture:
+        st.markdown(picture, unsafe_allow_html=True)
+        return
+    
+    # Not built yet: fall back to the source file
+    source = os.path.join(media_pipeline.SOURCE_DIR, question['image'])
+    if os.path.exists(source):
+        st.image(source)
+
+def render_question_stem(question):
+    lines = []
+    if 'difficulty' in question:
+        lines.append(f"*Difficulty: {question['difficulty'].capitalize()}*")
+    lines.append(f"*{question['question']}*")
+    return "\n\n".join(lines)
+
 def display_question():
     questions = st.session_state.quiz['current_questions']
     if not questions:
@@ -304,23 +361,31 @@ def display_question():
     
     st.markdown(f"**Question {idx + 1} of {len(questions)}**")
     
-    if 'difficulty' in question:
-        difficulty = question['difficulty'].capitalize()
-        st.markdown(f"*Difficulty: {difficulty}*")
+    st.markdown(question_block(question, 'stem', lambda: render_question_stem(question)))
+    
+    if question.get('image'):
+        display_question_image(question)
     
-    st.markdown(f"*{question['question']}*")
+    upcoming = [q.get('image') for q in questions[idx + 1:idx + 1 + PRELOAD_AHEAD] if q.get('image')]
+    if upcoming:
+        st.markdown(media_pipeline.preload_html(upcoming), unsafe_allow_html=True)
     
     options = question.get('options', [])
     user_answer = st.radio("Select your answer:", options, key=f"q{idx}")
     
     if st.button("Submit Answer", use_container_width=True):
         process_answer(question, user_answer)
+    
+    checkpoint_session()
+    key = st.session_state.resume_key
+    st.caption(f"Resume code: {key} (open this page with ?resume={key} on any device to continue)")
 
 def start_random_mix():
+    all_questions = get_all_questions()
     questions = []
     for category in CATEGORIES:
         for difficulty in ['easy', 'medium', 'hard']:
-            category_questions = st.session_state.quiz['all_questions'][category].get(difficulty, [])
+            category_questions = all_questions[category].get(difficulty, [])
             if category_questions:
                 questions.extend(category_questions)
     
@@ -340,15 +405,17 @@ def start_random_mix():
         'submitted': False,
         'score': 0,
         'time_spent': [],
+        'answers': [],
         'test_type': 'random_mix'
     })
     st.rerun()
 
 def start_quick_quiz():
+    all_questions = get_all_questions()
     questions = []
     for category in CATEGORIES:
         for difficulty in ['easy', 'medium', 'hard']:
-            category_questions = st.session_state.quiz['all_questions'][category].get(difficulty, [])
+            category_questions = all_questions[category].get(difficulty, [])
             if category_questions:
                 questions.extend(category_questions)
     
@@ -367,14 +434,16 @@ def start_quick_quiz():
         'submitted': False,
         'score': 0,
         'time_spent': [],
+        'answers': [],
         'test_type': 'quick_quiz'
     })
     st.rerun()
 
 def start_super_hard_exam():
+    all_questions = get_all_questions()
     questions = []
     for category in CATEGORIES:
-        category_questions = st.session_state.quiz['all_questions'][category].get('hard', [])
+        category_questions = all_questions[category].get('hard', [])
         if category_questions:
             questions.extend(random.sample(category_questions, min(3, len(category_questions))))
     
@@ -393,18 +462,20 @@ def start_super_hard_exam():
         'submitted': False,
         'score': 0,
         'time_spent': [],
+        'answers': [],
         'test_type': 'super_hard'
     })
     st.rerun()
 
 def start_balanced_exam(exam_number):
+    all_questions = get_all_questions()
     questions = []
     target_per_difficulty = 10
     
     for difficulty in ['easy', 'medium', 'hard']:
         difficulty_questions = []
         for category in CATEGORIES:
-            cat_questions = st.session_state.quiz['all_questions'][category].get(difficulty, [])
+            cat_questions = all_questions[category].get(difficulty, [])
             if cat_questions:
                 difficulty_questions.extend(random.sample(cat_questions, min(2, len(cat_questions))))
         
@@ -426,15 +497,17 @@ def start_balanced_exam(exam_number):
         'submitted': False,
         'score': 0,
         'time_spent': [],
+        'answers': [],
         'test_type': 'balanced_exam',
         'exam_number': exam_number
     })
     st.rerun()
 
 def start_practice_test(difficulty):
+    all_questions = get_all_questions()
     questions = []
     for category in CATEGORIES:
-        category_questions = st.session_state.quiz['all_questions'][category].get(difficulty, [])
+        category_questions = all_questions[category].get(difficulty, [])
         if category_questions:
             questions.extend(random.sample(category_questions, min(2, len(category_questions))))
     
@@ -453,11 +526,13 @@ def start_practice_test(difficulty):
         'submitted': False,
         'score': 0,
         'time_spent': [],
+        'answers': [],
         'test_type': 'practice_test'
     })
     st.rerun()
 
 def show_category_selection():
+    all_questions = get_all_questions()
     # Force white background with gray content area
     st.markdown("""
     <style>
@@ -478,7 +553,7 @@ def show_category_selection():
     
     cols = st.columns(2)
     for i, category in enumerate(CATEGORIES):
-        total_questions = sum(len(st.session_state.quiz['all_questions'][category][d]) 
+        total_questions = sum(len(all_questions[category][d]) 
                           for d in ['easy', 'medium', 'hard'])
         
         with cols[i % 2]:
@@ -490,7 +565,7 @@ def show_category_selection():
             ):
                 questions = []
                 for difficulty in ['easy', 'medium', 'hard']:
-                    questions.extend(st.session_state.quiz['all_questions'][category][difficulty])
+                    questions.extend(all_questions[category][difficulty])
                 
                 st.session_state.quiz.update({
                     'current_questions': questions,
@@ -501,6 +576,7 @@ def show_category_selection():
                     'submitted': False,
                     'score': 0,
                     'time_spent': [],
+                    'answers': [],
                     'test_type': 'category'
                 })
                 st.rerun()
@@ -511,25 +587,17 @@ def show_category_selection():
 
 def show_registration_stats():
     progress = st.session_state.progress
-    st.markdown("""
-    <div class='metric-card'>
-        <div style="font-size: 16px; color: #7f8c8d;">Total Registration Clicks</div>
-        <div style="font-size: 24px; font-weight: bold; color: #2c3e50;">{}</div>
-    </div>
-    """.format(progress.get('registration_clicks', 0)), unsafe_allow_html=True)
-    
+    clicks = progress.get('registration_clicks', 0)
     last_click = progress.get('last_registration_click')
+    st.markdown(cached_fragment(('registration_stats', clicks, last_click), lambda: render_registration_stats(clicks, last_click)),
+                unsafe_allow_html=True)
+
+def render_registration_stats(clicks, last_click):
     if last_click:
         last_click = datetime.fromisoformat(last_click).strftime("%Y-%m-%d %H:%M")
     else:
         last_click = "Never"
-    
-    st.markdown("""
-    <div class='metric-card'>
-        <div style="font-size: 16px; color: #7f8c8d;">Last Registration Click</div>
-        <div style="font-size: 24px; font-weight: bold; color: #2c3e50;">{}</div>
-    </div>
-    """.format(last_click), unsafe_allow_html=True)
+    return metric_card_html("Total Registration Clicks", clicks) + metric_card_html("Last Registration Click", last_click)
 
 def show_progress_tracking():
     st.markdown("""
@@ -539,8 +607,7 @@ def show_progress_tracking():
     """, unsafe_allow_html=True)
     
     try:
-        with open('Data/progress_data.json', 'r') as f:
-            progress_data = json.load(f)
+        progress_data = load_progress_data()
     except:
         progress_data = st.session_state.progress
     
@@ -562,30 +629,18 @@ def show_progress_tracking():
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("""
-        <div class='metric-card'>
-            <div style="font-size: 16px; color: #7f8c8d;">Total Attempts</div>
-            <div style="font-size: 24px; font-weight: bold; color: #2c3e50;">{}</div>
-        </div>
-        """.format(len(progress_data['attempts'])), unsafe_allow_html=True)
-    with col2:
-        avg_score = sum(progress_data['scores'])/len(progress_data['scores'])
-        st.markdown("""
-        <div class='metric-card'>
-            <div style="font-size: 16px; color: #7f8c8d;">Average Score</div>
-            <div style="font-size: 24px; font-weight: bold; color: #2c3e50;">{:.1%}</div>
-        </div>
-        """.format(avg_score), unsafe_allow_html=True)
-    with col3:
-        total_time = sum(progress_data['time_spent'])/60
-        st.markdown("""
-        <div class='metric-card'>
-            <div style="font-size: 16px; color: #7f8c8d;">Total Study Time</div>
-            <div style="font-size: 24px; font-weight: bold; color: #2c3e50;">{:.1f} min</div>
-        </div>
-        """.format(total_time), unsafe_allow_html=True)
+    attempts = len(progress_data['attempts'])
+    avg_score = sum(progress_data['scores'])/len(progress_data['scores'])
+    total_time = sum(progress_data['time_spent'])/60
+    cards = (
+        metric_card_html("Total Attempts", attempts),
+        metric_card_html("Average Score", f"{avg_score:.1%}"),
+        metric_card_html("Total Study Time", f"{total_time:.1f} min")
+    )
+    
+    for col, card in zip(st.columns(3), cards):
+        with col:
+            st.markdown(card, unsafe_allow_html=True)
     
     # Registration Stats
     st.markdown("""
@@ -602,6 +657,7 @@ def show_progress_tracking():
     </div>
     """, unsafe_allow_html=True)
     
+    plt = get_pyplot()
     fig, ax = plt.subplots(1, 2, figsize=(12, 4))
     
     # Score progression
@@ -636,6 +692,16 @@ def show_progress_tracking():
     }
     st.table(progress_table)
     
+    if os.environ.get("CFA_SHOW_CACHE_STATS"):
+        with st.expander("Render cache statistics"):
+            st.table(render_cache.stats())
+        with st.expander("Persistence writer statistics"):
+            st.table([progress_writer.get_writer().stats()])
+        reload_status = question_bank.reload_status()
+        if reload_status['last_error']:
+            st.warning(f"Question bank reload failed ({reload_status['errors']} attempts), "
+                       f"still serving version {reload_status['version']}: {reload_status['last_error']}")
+    
     if st.button("← Back to Main Menu", use_container_width=True):
         st.session_state.quiz['mode'] = 'main_menu'
         st.rerun()
@@ -740,8 +806,7 @@ def show_main_menu():
     
     # Stats summary card
     try:
-        with open('Data/progress_data.json', 'r') as f:
-            progress_data = json.load(f)
+        progress_data = load_progress_data()
         attempts = len(progress_data['attempts'])
         avg_score = f"{sum(progress_data['scores'])/attempts:.1%}" if attempts > 0 else "N/A"
         
@@ -793,6 +858,14 @@ def show_main_menu():
             st.session_state.quiz['mode'] = 'progress_tracking'
             st.rerun()
     
+    with st.expander("Resume a quiz from another device"):
+        code = st.text_input("Resume code")
+        if st.button("Resume Quiz", use_container_width=True) and code:
+            if resume_session(code.strip()):
+                st.rerun()
+            else:
+                st.error("No saved quiz found for that code")
+    
     # Practice options
     st.markdown("""
     <div class='card'>
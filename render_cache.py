@@ -0,0 +1,95 @@
+# Process-wide caches for rendered HTML/markdown fragments.
+#
+# Entries are evicted least-recently-used once a cache is full and expire
+# after a TTL. Hit/miss/eviction counters are kept per cache so sizes can be
+# tuned from production numbers; sizes and TTLs come from the environment.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUTTLCache:
+    def __init__(self, name, maxsize=256, ttl=300.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key, build):
+        # Built outside the lock; two sessions racing on a miss both render,
+        # which is cheaper than making one wait
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = build()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'cache': self.name,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+
+# ===== SHARED INSTANCES =====
+# Question stems, difficulty lines and explanations, keyed by question ID and content hash
+question_blocks = LRUTTLCache(
+    'question_blocks',
+    maxsize=int(os.environ.get('CFA_QUESTION_CACHE_SIZE', 4096)),
+    ttl=float(os.environ.get('CFA_QUESTION_CACHE_TTL', 3600)),
+)
+
+# Dashboard fragments that are costlier to build than to look up, keyed by their inputs
+fragments = LRUTTLCache(
+    'fragments',
+    maxsize=int(os.environ.get('CFA_FRAGMENT_CACHE_SIZE', 1024)),
+    ttl=float(os.environ.get('CFA_FRAGMENT_CACHE_TTL', 600)),
+)
+
+def stats():
+    return [question_blocks.stats(), fragments.stats()]
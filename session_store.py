@@ -0,0 +1,178 @@
+# Resumable quiz sessions.
+#
+# An in-progress quiz is packed into a small versioned record: question IDs,
+# chosen answer indices, per-question timing in tenths of a second and a few
+# scalars, JSON-encoded and zlib-compressed (a few hundred bytes for a
+# 30-question exam). Records live in a SQLite table keyed by resume code, so
+# any device or worker process sharing the Data/ directory can pick a quiz
+# up. Restoring resolves IDs through the in-memory question index and never
+# re-reads the bank file.
+#
+# Each ID is stored with a hash of the question content it was saved with.
+# On restore, a question that was edited since is matched against the
+# versions this process still has; if none matches, the quiz is refused when
+# the question was already answered (its answer index points into the old
+# options) and otherwise continues with the current version.
+#
+# Storage limit: the default store is a local SQLite file. On hosts with an
+# ephemeral filesystem (Heroku dynos are wiped on every restart and deploy,
+# at least daily, and dynos don't share disks) saved quizzes only survive
+# as long as the dyno and only resume on the dyno that saved them. Point
+# CFA_SESSIONS_DB at a persistent, shared volume where the host has one.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import progress_writer
+import question_bank
+
+SESSIONS_DB_PATH = os.environ.get('CFA_SESSIONS_DB', 'Data/sessions.db')
+FORMAT_VERSION = 2
+RECORD_FIELDS = 13
+NO_ANSWER = -1
+
+
+# ===== SERIALIZATION =====
+def _ds(seconds):
+    return int(round(seconds * 10))
+
+def serialize(quiz, now=None):
+    now = time.time() if now is None else now
+    questions = quiz['current_questions']
+    record = [
+        FORMAT_VERSION,
+        [question_bank.question_key(q) for q in questions],
+        quiz.get('answers', []),
+        [_ds(t) for t in quiz['time_spent']],
+        quiz['score'],
+        quiz['current_index'],
+        int(quiz['submitted']),
+        _ds(now - quiz['start_time']),
+        _ds(now - quiz['question_start']),
+        quiz.get('test_type'),
+        quiz.get('selected_category'),
+        quiz.get('exam_number'),
+        [question_bank.content_hash(q) for q in questions],
+    ]
+    return zlib.compress(json.dumps(record, separators=(',', ':')).encode(), 9)
+
+def resolve_question(question_id, digest):
+    # Returns (question, pinned): pinned is False when only a different
+    # version of the question than the saved one is available
+    question = question_bank.get_question_version(question_id, digest)
+    if question is not None:
+        return question, True
+    question = question_bank.get_question(question_id)
+    if question is None and question_id.startswith("TPL-"):
+        # Generated questions are deterministic, so the hash normally matches
+        import question_generator
+        question = question_generator.get_question(question_id)
+    return question, question is not None and question_bank.content_hash(question) == digest
+
+def deserialize(blob, now=None):
+    # Returns the quiz fields to restore, or None if the record is from an
+    # unknown format, refers to questions that no longer exist, or an answered
+    # question has changed since it was saved
+    now = time.time() if now is None else now
+    # A truncated or corrupt row must not break every reload of its resume link
+    try:
+        record = json.loads(zlib.decompress(blob))
+    except (zlib.error, ValueError, TypeError):
+        return None
+    if not isinstance(record, list) or len(record) != RECORD_FIELDS or record[0] != FORMAT_VERSION:
+        return None
+    (_, ids, answers, deltas, score, index, submitted, elapsed, question_elapsed,
+     test_type, selected_category, exam_number, digests) = record
+
+    try:
+        if len(ids) != len(digests) or not all(isinstance(qid, str) for qid in ids):
+            return None
+        questions = []
+        updated = 0
+        for i, (qid, digest) in enumerate(zip(ids, digests)):
+            question, pinned = resolve_question(qid, digest)
+            if question is None or (not pinned and i < len(answers)):
+                return None
+            questions.append(question)
+            updated += not pinned
+        time_spent = [d / 10 for d in deltas]
+        start_time = now - elapsed / 10
+        question_start = now - question_elapsed / 10
+    except (TypeError, ValueError):
+        return None
+    return {
+        'current_questions': questions,
+        'answers': answers,
+        'time_spent': time_spent,
+        'score': score,
+        'current_index': index,
+        'submitted': bool(submitted),
+        'start_time': start_time,
+        'question_start': question_start,
+        'test_type': test_type,
+        'selected_category': selected_category,
+        'exam_number': exam_number,
+        'mode': 'question',
+        'updated_questions': updated,
+    }
+
+# ===== STORAGE =====
+class SessionStore:
+    def __init__(self, path=SESSIONS_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        # One connection per thread; WAL lets worker processes read while one writes
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS quiz_sessions ("
+                "session_key TEXT PRIMARY KEY, state BLOB NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def load(self, key):
+        # Sees saves still queued in this process before checking the table
+        queued = progress_writer.get_writer().pending(('session', key))
+        if queued is not None:
+            return queued[0]
+        row = self._connection().execute(
+            "SELECT state FROM quiz_sessions WHERE session_key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def save(self, key, blob):
+        return progress_writer.get_writer().submit(('session', key), blob, lambda state: self._write(key, state))
+
+    def delete(self, key):
+        return self.save(key, None)
+
+    def _write(self, key, state):
+        conn = self._connection()
+        with conn:
+            if state is None:
+                conn.execute("DELETE FROM quiz_sessions WHERE session_key = ?", (key,))
+            else:
+                conn.execute(
+                    "INSERT INTO quiz_sessions (session_key, state, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(session_key) DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at",
+                    (key, state, time.time())
+                )
+
+
+_store = None
+
+def get_store():
+    global _store
+    if _store is None:
+        _store = SessionStore()
+    return _store
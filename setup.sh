@@ -3,4 +3,5 @@ echo "[server]
 headless = true
 enableCORS = false
 port = $PORT
+enableStaticServing = true
 " > ~/.streamlit/config.toml
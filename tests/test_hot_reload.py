@@ -0,0 +1,88 @@
+import json
+import os
+import time
+
+import pytest
+
+import question_bank
+import session_store
+
+
+def make_question(qid, explanation="Because."):
+    return {
+        "id": qid,
+        "topic": "Fixed Income",
+        "difficulty": "easy",
+        "question": f"Question {qid}?",
+        "options": ["A", "B", "C"],
+        "correct_answer": "A",
+        "explanation": explanation,
+    }
+
+
+def write_bank(path, questions):
+    with open(path, 'w') as f:
+        json.dump({"questions": questions}, f)
+    # Make sure the signature changes even on coarse mtime filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def bank_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "questions.json")
+    write_bank(path, [make_question("Q1"), make_question("Q2")])
+    questions = question_bank.read_questions(path)
+    monkeypatch.setattr(question_bank, '_bank', question_bank.build_bank(questions))
+    monkeypatch.setattr(question_bank, '_by_id', {question_bank.question_key(q): q for q in questions})
+    monkeypatch.setattr(question_bank, '_retired', {})
+    monkeypatch.setattr(question_bank, '_signature', question_bank.file_signature(path))
+    return path
+
+
+def test_changed_question_keeps_old_version_by_hash(bank_path):
+    old = question_bank.get_question("Q1")
+    old_digest = question_bank.content_hash(old)
+
+    write_bank(bank_path, [make_question("Q1", "Edited."), make_question("Q2")])
+    diff = question_bank.reload_if_changed(bank_path)
+
+    assert diff['changed'] == ["Q1"]
+    assert question_bank.get_question("Q1")['explanation'] == "Edited."
+    assert question_bank.get_question_version("Q1", old_digest) is old
+
+
+def test_answered_question_restores_after_edit(bank_path):
+    questions = [question_bank.get_question("Q1"), question_bank.get_question("Q2")]
+    now = time.time()
+    quiz = {
+        'current_questions': questions,
+        'answers': [0],
+        'time_spent': [3.0],
+        'score': 1,
+        'current_index': 1,
+        'submitted': False,
+        'start_time': now - 10,
+        'question_start': now - 2,
+    }
+    blob = session_store.serialize(quiz, now)
+
+    write_bank(bank_path, [make_question("Q1", "Edited."), make_question("Q2")])
+    question_bank.reload_if_changed(bank_path)
+
+    state = session_store.deserialize(blob, now)
+    assert state is not None
+    assert state['current_questions'][0] is questions[0]
+    assert state['updated_questions'] == 0
+
+
+def test_malformed_file_keeps_current_bank(bank_path):
+    before = question_bank.get_question("Q1")
+    bad = make_question("Q1", "Edited.")
+    del bad["options"]
+
+    write_bank(bank_path, [bad, make_question("Q2")])
+    with pytest.raises(ValueError):
+        question_bank.reload_if_changed(bank_path)
+
+    assert question_bank.get_question("Q1") is before